@@ -35,6 +35,10 @@ setup(
         ]
     },
     install_requires=find_required(),
+    extras_require={
+        "orjson": ["orjson>=3.8,<4.0"],
+        "pybase64": ["pybase64>=1.3,<2.0"],
+    },
     tests_require=find_dev_required(),
     classifiers=[
         "License :: OSI Approved :: Apache Software License",
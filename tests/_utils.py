@@ -1,5 +1,5 @@
 from typing import Any, Callable, List, Optional, Tuple
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
 
 import httpx
 import pytest
@@ -135,7 +135,7 @@ def request_recorder(builder: HARBuilder, sync_formatter: SyncHARFormatter,
 
 @pytest.fixture
 def request_recorder_() -> Mock:
-    return Mock(spec=RequestRecorder)
+    return Mock(spec=RequestRecorder, async_record=AsyncMock())
 
 
 @pytest.fixture
@@ -1,4 +1,5 @@
 from datetime import datetime
+from time import perf_counter_ns
 
 import httpx
 from baby_steps import given, then, when
@@ -163,3 +164,59 @@ async def test_async_format_responses(*, async_formatter: AsyncHARFormatter,
             ],
             "pages": [],
         }
+
+
+async def test_async_format_many_responses(*, async_formatter: AsyncHARFormatter,
+                                           respx_mock: RouterType,
+                                           async_httpx_client: AsyncHTTPClientType):
+    with given:
+        respx_mock.get(url__regex=r"/\d+").respond(200)
+        async with async_httpx_client() as client:
+            responses = [await client.get(f"/{index}") for index in range(40)]
+
+    with when:
+        result = await async_formatter.format(responses)
+
+    with then:
+        assert [entry["request"]["url"] for entry in result["entries"]] == [
+            build_url(f"/{index}") for index in range(40)
+        ]
+
+
+def test_sync_format_entry_open_response_elapsed(*, sync_formatter: SyncHARFormatter):
+    with given:
+        request = httpx.Request("GET", build_url())
+        request.extensions["vedro_httpx_started_at_ns"] = perf_counter_ns() - 1_500_000_000
+        response = httpx.Response(200, request=request)
+
+    with when:
+        result = sync_formatter.format_entry(response, request)
+
+    with then:
+        assert 1500 <= result["time"] < 60_000
+
+
+async def test_async_format_response_content_not_read(*, async_formatter: AsyncHARFormatter):
+    with given:
+        response = httpx.Response(200, headers={"content-type": "text/plain"},
+                                  stream=httpx.ByteStream(b"body"))
+
+    with when:
+        result = await async_formatter.format_response_content(response)
+
+    with then:
+        assert result == {"size": 4, "mimeType": "text/plain", "text": "body"}
+
+
+def test_sync_format_entry_started_at_wall_ns(*, sync_formatter: SyncHARFormatter):
+    with given:
+        started_at = datetime(2024, 1, 1, 12, 30, 15, 250000)
+        request = httpx.Request("GET", build_url())
+        request.extensions["vedro_httpx_started_at_wall_ns"] = int(started_at.timestamp() * 1e9)
+        response = httpx.Response(200, request=request)
+
+    with when:
+        result = sync_formatter.format_entry(response, request)
+
+    with then:
+        assert result["startedDateTime"] == started_at.isoformat()
@@ -180,6 +180,26 @@ def test_post_request_binary_data(*, sync_formatter: SyncHARFormatter, respx_moc
         )
 
 
+def test_post_request_invalid_utf8_text(*, sync_formatter: SyncHARFormatter,
+                                        respx_mock: RouterType,
+                                        sync_httpx_client: HTTPClientType):
+    with given:
+        respx_mock.post("/").respond(200)
+        with sync_httpx_client() as client:
+            response = client.post("/", content=b"caf\xe9", headers={
+                "content-type": "text/plain"
+            })
+
+    with when:
+        result = sync_formatter.format_request(response.request)
+
+    with then:
+        assert result["postData"] == {
+            "mimeType": "text/plain",
+            "text": "caf\ufffd"
+        }
+
+
 def test_post_request_form_data(*, sync_formatter: SyncHARFormatter, respx_mock: RouterType,
                                 sync_httpx_client: HTTPClientType):
     with given:
@@ -208,6 +228,36 @@ def test_post_request_form_data(*, sync_formatter: SyncHARFormatter, respx_mock:
         )
 
 
+def test_post_request_form_data_blank_values(*, sync_formatter: SyncHARFormatter,
+                                             respx_mock: RouterType,
+                                             sync_httpx_client: HTTPClientType):
+    with given:
+        respx_mock.post("/").respond(200)
+        with sync_httpx_client() as client:
+            response = client.post("/", data={"id": "1", "name": "", "q": "100%"})
+
+    with when:
+        result = sync_formatter.format_request(response.request)
+
+    with then:
+        assert result == build_request(
+            method="POST",
+            headers=[
+                {"name": "content-length", "value": "19"},
+                {"name": "content-type", "value": "application/x-www-form-urlencoded"},
+            ],
+            postData={
+                "mimeType": "application/x-www-form-urlencoded",
+                "text": "id=1&name=&q=100%25",
+                "params": [
+                    {"name": "id", "value": "1"},
+                    {"name": "name", "value": ""},
+                    {"name": "q", "value": "100%"},
+                ]
+            }
+        )
+
+
 def test_post_request_multipart_data(*, sync_formatter: SyncHARFormatter, respx_mock: RouterType,
                                      sync_httpx_client: HTTPClientType):
     with given:
@@ -322,3 +372,164 @@ def test_post_request_multipart_data_with_files(*, sync_formatter: SyncHARFormat
                 ]
             }
         )
+
+
+def test_post_request_multipart_binary_file(*, sync_formatter: SyncHARFormatter,
+                                            respx_mock: RouterType,
+                                            sync_httpx_client: HTTPClientType):
+    with given:
+        respx_mock.post("/").respond(200)
+        with sync_httpx_client() as client:
+            boundary = "boundary"
+            content = b"\r\n".join([
+                f"--{boundary}".encode(),
+                b'Content-Disposition: form-data; name="file"; filename="image.png"',
+                b"Content-Type: image/png",
+                b"",
+                b"\x89PNG\r\n\x1a\n\xff",
+                f"--{boundary}--".encode(),
+                b""
+            ])
+            response = client.post("/", content=content, headers={
+                "content-type": f'multipart/form-data; boundary="{boundary}"'
+            })
+
+    with when:
+        result = sync_formatter.format_request(response.request)
+
+    with then:
+        assert result["postData"] == {
+            "mimeType": f'multipart/form-data; boundary="{boundary}"',
+            "params": [
+                {
+                    "name": "file",
+                    "value": "(binary)",
+                    "fileName": "image.png",
+                    "contentType": "image/png",
+                }
+            ],
+            "text": "\r\n".join([
+                f"--{boundary}",
+                'Content-Disposition: form-data; name="file"; filename="image.png"',
+                "Content-Type: image/png",
+                "",
+                "(binary)",
+                f"--{boundary}--",
+                ""
+            ]),
+        }
+
+
+def test_post_request_multipart_extended_filename(*, sync_formatter: SyncHARFormatter,
+                                                  respx_mock: RouterType,
+                                                  sync_httpx_client: HTTPClientType):
+    with given:
+        respx_mock.post("/").respond(200)
+        with sync_httpx_client() as client:
+            boundary = "boundary"
+            content = b"\r\n".join([
+                f"--{boundary}".encode(),
+                (b'Content-Disposition: form-data; name="file"; filename="euro.txt"; '
+                 b"filename*=UTF-8''%E2%82%AC.txt"),
+                b"",
+                b"1",
+                f"--{boundary}--".encode(),
+                b""
+            ])
+            response = client.post("/", content=content, headers={
+                "content-type": f"multipart/form-data; boundary={boundary}"
+            })
+
+    with when:
+        result = sync_formatter.format_request(response.request)
+
+    with then:
+        assert result["postData"]["params"] == [
+            {
+                "name": "file",
+                "value": "(binary)",
+                "fileName": "\u20ac.txt",
+                "contentType": "text/plain",
+            }
+        ]
+
+
+@pytest.mark.parametrize(("transfer_encoding", "encoded"), [
+    ("base64", b"aGk="),
+    ("quoted-printable", b"h=69"),
+])
+def test_post_request_multipart_transfer_encoding(transfer_encoding: str, encoded: bytes, *,
+                                                  sync_formatter: SyncHARFormatter,
+                                                  respx_mock: RouterType,
+                                                  sync_httpx_client: HTTPClientType):
+    with given:
+        respx_mock.post("/").respond(200)
+        with sync_httpx_client() as client:
+            boundary = "boundary"
+            content = b"\r\n".join([
+                f"--{boundary}".encode(),
+                b'Content-Disposition: form-data; name="field"',
+                f"Content-Transfer-Encoding: {transfer_encoding}".encode(),
+                b"",
+                encoded,
+                f"--{boundary}--".encode(),
+                b""
+            ])
+            response = client.post("/", content=content, headers={
+                "content-type": f"multipart/form-data; boundary={boundary}"
+            })
+
+    with when:
+        result = sync_formatter.format_request(response.request)
+
+    with then:
+        assert result["postData"]["params"] == [{"name": "field", "value": "hi"}]
+
+
+def test_post_request_multipart_no_boundary(*, sync_formatter: SyncHARFormatter,
+                                            respx_mock: RouterType,
+                                            sync_httpx_client: HTTPClientType):
+    with given:
+        respx_mock.post("/").respond(200)
+        with sync_httpx_client() as client:
+            response = client.post("/", content=b"id=1", headers={
+                "content-type": "multipart/form-data"
+            })
+
+    with when:
+        result = sync_formatter.format_request(response.request)
+
+    with then:
+        assert result["postData"] == {
+            "mimeType": "multipart/form-data",
+            "params": [],
+            "text": "id=1",
+        }
+
+
+def test_post_request_stream_consumed(*, sync_formatter: SyncHARFormatter):
+    with given:
+        def stream():
+            yield b"chunk"
+
+        request = httpx.Request("POST", build_url(), content=stream(),
+                                headers={"content-type": "text/plain"})
+        # Sending the request through a real transport consumes the stream without caching it
+        list(request.stream)
+
+    with when:
+        result = sync_formatter.format_request(request)
+
+    with then:
+        assert result == {
+            **build_request(method="POST", postData={
+                "mimeType": "text/plain",
+                "text": "(stream)",
+                "comment": "Stream consumed",
+            }),
+            "headers": [
+                {"name": "host", "value": "localhost"},
+                {"name": "content-type", "value": "text/plain"},
+                {"name": "transfer-encoding", "value": "chunked"},
+            ],
+        }
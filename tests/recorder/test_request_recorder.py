@@ -1,7 +1,9 @@
 import json
 from pathlib import Path
+from typing import Any, Dict, List
 from unittest.mock import AsyncMock, MagicMock, Mock
 
+import httpx
 import pytest
 from baby_steps import given, then, when
 
@@ -53,6 +55,25 @@ def test_disable(*, request_recorder: RequestRecorder):
         assert not request_recorder.is_enabled()
 
 
+async def test_set_max_body_bytes(*, request_recorder: RequestRecorder,
+                                  sync_formatter: SyncHARFormatter,
+                                  async_formatter: AsyncHARFormatter):
+    with given:
+        response = httpx.Response(200, content=b"binary")
+
+    with when:
+        request_recorder.set_max_body_bytes(4)
+
+    with then:
+        expected = {
+            "size": 6,
+            "mimeType": "x-unknown",
+            "comment": "Body exceeds 4 bytes, not recorded",
+        }
+        assert sync_formatter.format_response_content(response) == expected
+        assert await async_formatter.format_response_content(response) == expected
+
+
 def test_record_sync_enabled(*, builder: HARBuilder, sync_formatter_: Mock,
                              async_formatter_: Mock):
     with given:
@@ -129,3 +150,49 @@ def test_save_requests(*, request_recorder: RequestRecorder, tmp_path: Path):
                 "pages": []
             }
         }
+
+
+@pytest.mark.parametrize("entries", [
+    [{"text": "Привет", "items": [], "headers": {}}],
+    [{"id": 2 ** 70}],
+])
+def test_save_requests_text(entries: List[Dict[str, Any]], *, builder: HARBuilder,
+                            sync_formatter_: Mock, async_formatter_: Mock, tmp_path: Path):
+    with given:
+        request_recorder = RequestRecorder(builder, sync_formatter_, async_formatter_)
+        request_recorder.enable()
+
+        sync_formatter_.format_entry.side_effect = entries
+        for _ in entries:
+            request_recorder.sync_record(response=MagicMock())
+
+        file_path = tmp_path / "requests.har"
+
+    with when:
+        request_recorder.save(file_path)
+
+    with then:
+        log = builder.build_log(entries)  # type: ignore
+        expected = json.dumps(builder.build_har(log), indent=2, ensure_ascii=False)
+        assert file_path.read_text(encoding="utf-8") == expected
+
+
+def test_save_requests_max_entries(*, builder: HARBuilder, sync_formatter_: Mock,
+                                   async_formatter_: Mock, tmp_path: Path):
+    with given:
+        request_recorder = RequestRecorder(builder, sync_formatter_, async_formatter_,
+                                           max_entries=2)
+        request_recorder.enable()
+
+        sync_formatter_.format_entry.side_effect = [{"id": 1}, {"id": 2}, {"id": 3}]
+        for _ in range(3):
+            request_recorder.sync_record(response=MagicMock())
+
+        file_path = tmp_path / "requests.har"
+
+    with when:
+        request_recorder.save(file_path)
+
+    with then:
+        har = json.loads(file_path.read_text())
+        assert har["log"]["entries"] == [{"id": 2}, {"id": 3}]
@@ -1,16 +1,21 @@
+import gzip
+
+import httpx
+import pytest
 from baby_steps import given, then, when
 
 from tests._utils import (
     HTTPClientType,
     RouterType,
     build_response,
+    build_url,
     builder,
     respx_mock,
     sync_formatter,
     sync_httpx_client,
     sync_transport,
 )
-from vedro_httpx.recorder import SyncHARFormatter
+from vedro_httpx.recorder import HARBuilder, SyncHARFormatter
 
 __all__ = ("sync_formatter", "sync_httpx_client", "sync_transport", "builder",
            "respx_mock",)  # fixtures
@@ -141,6 +146,50 @@ def test_response_with_cookies(*, sync_formatter: SyncHARFormatter, respx_mock:
         )
 
 
+def test_response_with_cookie_attributes(*, sync_formatter: SyncHARFormatter,
+                                         respx_mock: RouterType,
+                                         sync_httpx_client: HTTPClientType):
+    with given:
+        set_cookie = 'token="abc def"; expires=invalid; secure; Path=/api'
+        respx_mock.get("/").respond(200, headers=[("set-cookie", set_cookie)])
+        with sync_httpx_client() as client:
+            response = client.get("/")
+
+    with when:
+        result = sync_formatter.format_response(response)
+
+    with then:
+        assert result["cookies"] == [
+            {
+                "name": "token",
+                "value": "abc def",
+                "path": "/api",
+                "secure": True,
+                "comment": "Invalid date format: invalid",
+            }
+        ]
+
+
+@pytest.mark.parametrize(("set_cookie", "value"), [
+    ('token="x;y"; Path=/', "x;y"),
+    ('token="\\054b"; Path=/', ",b"),
+    ('token="a\\"b"; Path=/', 'a"b'),
+])
+def test_response_with_quoted_cookie(set_cookie: str, value: str, *,
+                                     sync_formatter: SyncHARFormatter, respx_mock: RouterType,
+                                     sync_httpx_client: HTTPClientType):
+    with given:
+        respx_mock.get("/").respond(200, headers=[("set-cookie", set_cookie)])
+        with sync_httpx_client() as client:
+            response = client.get("/")
+
+    with when:
+        result = sync_formatter.format_response(response)
+
+    with then:
+        assert result["cookies"] == [{"name": "token", "value": value, "path": "/"}]
+
+
 def test_response_with_text_content(*, sync_formatter: SyncHARFormatter, respx_mock: RouterType,
                                     sync_httpx_client: HTTPClientType):
     with given:
@@ -189,6 +238,60 @@ def test_response_with_json_content(*, sync_formatter: SyncHARFormatter, respx_m
         )
 
 
+@pytest.mark.parametrize("content_type", [
+    "application/problem+json",
+    "application/vnd.api+json; charset=utf-8",
+    "image/svg+xml",
+])
+def test_response_with_structured_suffix_content(content_type: str, *,
+                                                 sync_formatter: SyncHARFormatter,
+                                                 respx_mock: RouterType,
+                                                 sync_httpx_client: HTTPClientType):
+    with given:
+        respx_mock.get("/").respond(200, content=b'{"key": "value"}', headers={
+            "content-type": content_type
+        })
+        with sync_httpx_client() as client:
+            response = client.get("/")
+
+    with when:
+        result = sync_formatter.format_response_content(response)
+
+    with then:
+        assert result == {
+            "size": 16,
+            "mimeType": content_type,
+            "text": '{"key": "value"}'
+        }
+
+
+@pytest.mark.parametrize("content_type", [
+    "Text/Plain; charset=UTF-8",
+    "APPLICATION/JSON",
+    "application/Problem+JSON",
+])
+def test_response_with_uppercase_text_content(content_type: str, *,
+                                              sync_formatter: SyncHARFormatter,
+                                              respx_mock: RouterType,
+                                              sync_httpx_client: HTTPClientType):
+    with given:
+        respx_mock.get("/").respond(200, content=b'{"key": "value"}', headers={
+            "content-type": content_type
+        })
+        with sync_httpx_client() as client:
+            response = client.get("/")
+
+    with when:
+        result = sync_formatter.format_response_content(response)
+
+    with then:
+        assert result == {
+            "size": 16,
+            "mimeType": content_type,
+            "text": '{"key": "value"}'
+        }
+
+
 def test_response_with_binary_content(*, sync_formatter: SyncHARFormatter, respx_mock: RouterType,
                                       sync_httpx_client: HTTPClientType):
     with given:
@@ -266,3 +369,71 @@ def test_stream_response(*, sync_formatter: SyncHARFormatter, respx_mock: Router
                 "comment": "Stream consumed"
             }
         )
+
+
+def test_response_content_declared_oversized(*, builder: HARBuilder):
+    with given:
+        sync_formatter = SyncHARFormatter(builder, max_body_bytes=4)
+        response = httpx.Response(200, headers={"content-length": "6"},
+                                  stream=httpx.ByteStream(b"binary"))
+
+    with when:
+        result = sync_formatter.format_response_content(response)
+
+    with then:
+        assert result == {
+            "size": 6,
+            "mimeType": "x-unknown",
+            "comment": "Body exceeds 4 bytes, not recorded",
+        }
+        assert not response.is_stream_consumed
+
+
+def test_response_content_declared_oversized_head(*, builder: HARBuilder):
+    with given:
+        sync_formatter = SyncHARFormatter(builder, max_body_bytes=10)
+        request = httpx.Request("HEAD", build_url())
+        response = httpx.Response(200, headers={"content-length": "1000"}, request=request)
+
+    with when:
+        result = sync_formatter.format_response_content(response)
+
+    with then:
+        assert result == {"size": 0, "mimeType": "x-unknown"}
+
+
+def test_response_content_declared_oversized_encoded(*, builder: HARBuilder):
+    with given:
+        sync_formatter = SyncHARFormatter(builder, max_body_bytes=10)
+        content = gzip.compress(b"a" * 1000)
+        response = httpx.Response(200, headers={
+            "content-encoding": "gzip",
+            "content-length": str(len(content)),
+        }, stream=httpx.ByteStream(content))
+
+    with when:
+        result = sync_formatter.format_response_content(response)
+
+    with then:
+        assert result == {
+            "size": 1000,
+            "mimeType": "x-unknown",
+            "comment": "Body exceeds 10 bytes, not recorded",
+        }
+
+
+def test_response_content_oversized(*, builder: HARBuilder):
+    with given:
+        sync_formatter = SyncHARFormatter(builder, max_body_bytes=4)
+        response = httpx.Response(200, content=b"binary")
+        del response.headers["content-length"]
+
+    with when:
+        result = sync_formatter.format_response_content(response)
+
+    with then:
+        assert result == {
+            "size": 6,
+            "mimeType": "x-unknown",
+            "comment": "Body exceeds 4 bytes, not recorded",
+        }
@@ -4,18 +4,24 @@ from baby_steps import given, then, when
 from httpx import MockTransport
 from vedro import Interface
 
-from vedro_httpx import AsyncHTTPInterface
+from vedro_httpx import AsyncClient, AsyncHTTPInterface
+from vedro_httpx.recorder import RequestRecorder
 
 from ._utils import (
     RouterType,
+    async_formatter,
     async_http_interface,
     async_transport,
     build_url,
+    builder,
+    request_recorder,
     request_recorder_,
     respx_mock,
+    sync_formatter,
 )
 
-__all__ = ("async_transport", "respx_mock", "request_recorder_",
+__all__ = ("builder", "sync_formatter", "async_formatter", "request_recorder",
+           "async_transport", "respx_mock", "request_recorder_",
            "async_http_interface",)  # fixtures
 
 
@@ -56,4 +62,35 @@ async def test_async_request_recorder(*, async_http_interface: AsyncHTTPInterfac
 
     with then:
         assert response.status_code == 200
-        assert request_recorder_.mock_calls == [call.async_record(response)]
+        assert request_recorder_.mock_calls == [
+            call.is_enabled(),
+            call.async_record(response),
+        ]
+
+
+async def test_async_client_started_at(*, request_recorder: RequestRecorder,
+                                       async_transport: MockTransport, respx_mock: RouterType):
+    with given:
+        request_recorder.enable()
+        client = AsyncClient(transport=async_transport, request_recorder=request_recorder)
+        respx_mock.get("/").respond(200)
+
+    with when:
+        response = await client.get(build_url())
+
+    with then:
+        assert "vedro_httpx_started_at_wall_ns" in response.request.extensions
+
+
+async def test_async_client_started_at_recorder_disabled(*, request_recorder: RequestRecorder,
+                                                         async_transport: MockTransport,
+                                                         respx_mock: RouterType):
+    with given:
+        client = AsyncClient(transport=async_transport, request_recorder=request_recorder)
+        respx_mock.get("/").respond(200)
+
+    with when:
+        response = await client.get(build_url())
+
+    with then:
+        assert "vedro_httpx_started_at_wall_ns" not in response.request.extensions
@@ -1,5 +1,3 @@
-from os import linesep
-
 from baby_steps import given, then, when
 from pygments.lexers import HttpLexer, JsonLexer, TextLexer
 from rich.syntax import Syntax
@@ -36,7 +34,7 @@ def test_format_response_headers():
         code, lexer = format_response_headers(response)
 
     with then:
-        assert code == linesep.join([
+        assert code == "\n".join([
             "HTTP/1.1 200 OK",
             "content-type: application/json",
             "set-cookie: lang=en",
@@ -45,6 +43,26 @@ def test_format_response_headers():
         assert isinstance(lexer, HttpLexer)
 
 
+def test_format_response_headers_order():
+    with given:
+        response = Response(status_code=200, headers=[
+            ("Set-Cookie", "lang=en"),
+            ("Content-Type", "application/json"),
+            ("Set-Cookie", "country=us")
+        ])
+
+    with when:
+        code, _ = format_response_headers(response)
+
+    with then:
+        assert code == "\n".join([
+            "HTTP/1.1 200 OK",
+            "set-cookie: lang=en",
+            "content-type: application/json",
+            "set-cookie: country=us"
+        ])
+
+
 def test_format_response_no_body():
     with given:
         response = Response(status_code=200)
@@ -85,6 +103,36 @@ def test_format_response_text():
         assert isinstance(lexer, TextLexer)
 
 
+def test_format_response_charset():
+    with given:
+        body = "Привет".encode("cp1251")
+        response = Response(status_code=200, content=body, headers={
+            "Content-Type": "text/plain; charset=windows-1251"
+        })
+
+    with when:
+        code, lexer = format_response_body(response)
+
+    with then:
+        assert code == "Привет"
+        assert isinstance(lexer, TextLexer)
+
+
+def test_format_response_invalid_utf8():
+    with given:
+        body = b"caf\xe9"
+        response = Response(status_code=200, content=body, headers={
+            "Content-Type": "text/plain; charset=utf-8"
+        })
+
+    with when:
+        code, lexer = format_response_body(response)
+
+    with then:
+        assert code == "caf\ufffd"
+        assert isinstance(lexer, TextLexer)
+
+
 def test_format_response_json():
     with given:
         body = b'{"id": 1}'
@@ -100,6 +148,90 @@ def test_format_response_json():
         assert isinstance(lexer, JsonLexer)
 
 
+def test_format_response_nested_json():
+    with given:
+        body = '{"user": {"name": "Алиса", "tags": ["a"]}}'.encode()
+        response = Response(status_code=200, content=body, headers={
+            "Content-Type": "application/json; charset=utf-8"
+        })
+
+    with when:
+        code, lexer = format_response_body(response)
+
+    with then:
+        assert code == "\n".join([
+            "{",
+            '    "user": {',
+            '        "name": "Алиса",',
+            '        "tags": [',
+            '            "a"',
+            "        ]",
+            "    }",
+            "}",
+        ])
+        assert isinstance(lexer, JsonLexer)
+
+
+def test_format_response_json_big_int():
+    with given:
+        body = b'{"id": 123456789012345678901234567890}'
+        response = Response(status_code=200, content=body, headers={
+            "Content-Type": "application/json"
+        })
+
+    with when:
+        code, lexer = format_response_body(response)
+
+    with then:
+        assert code == '{\n    "id": 123456789012345678901234567890\n}'
+        assert isinstance(lexer, JsonLexer)
+
+
+def test_format_response_json_bom():
+    with given:
+        body = b'\xef\xbb\xbf{"id": 1}'
+        response = Response(status_code=200, content=body, headers={
+            "Content-Type": "application/json"
+        })
+
+    with when:
+        code, lexer = format_response_body(response)
+
+    with then:
+        assert code == '{\n    "id": 1\n}'
+        assert isinstance(lexer, JsonLexer)
+
+
+def test_format_response_json_non_finite():
+    with given:
+        body = b'{"a": NaN, "b": Infinity, "c": -Infinity}'
+        response = Response(status_code=200, content=body, headers={
+            "Content-Type": "application/json"
+        })
+
+    with when:
+        code, lexer = format_response_body(response)
+
+    with then:
+        assert code == '{\n    "a": NaN,\n    "b": Infinity,\n    "c": -Infinity\n}'
+        assert isinstance(lexer, JsonLexer)
+
+
+def test_format_response_indented_json():
+    with given:
+        body = b'{\n  "id": 1\n}'
+        response = Response(status_code=200, content=body, headers={
+            "Content-Type": "application/json"
+        })
+
+    with when:
+        code, lexer = format_response_body(response)
+
+    with then:
+        assert code == '{\n  "id": 1\n}'
+        assert isinstance(lexer, JsonLexer)
+
+
 def test_format_response_invalid_json():
     with given:
         body = b'{"id"}'
@@ -115,6 +247,81 @@ def test_format_response_invalid_json():
         assert isinstance(lexer, TextLexer)
 
 
+def test_format_response_oversized_binary():
+    with given:
+        body = b"\x00" * (1024 * 1024 + 1)
+        response = Response(status_code=200, content=body, headers={
+            "Content-Type": "application/javascript"
+        })
+
+    with when:
+        code, lexer = format_response_body(response)
+
+    with then:
+        assert code == f"<binary preview={body[:10]} len={len(body)}>"
+        assert lexer == ""
+
+
+def test_format_response_oversized_text():
+    with given:
+        body = b"x" * (1024 * 1024 + 1)
+        response = Response(status_code=200, content=body, headers={
+            "Content-Type": "text/plain"
+        })
+
+    with when:
+        code, lexer = format_response_body(response)
+
+    with then:
+        assert code == "x" * (1024 * 1024) + f"… [truncated to {1024 * 1024} bytes]"
+        assert isinstance(lexer, TextLexer)
+
+
+def test_format_response_large_json():
+    with given:
+        body = b'{"items": [' + b"1," * (128 * 1024) + b"1]}"
+        response = Response(status_code=200, content=body, headers={
+            "Content-Type": "application/json"
+        })
+
+    with when:
+        code, lexer = format_response_body(response)
+
+    with then:
+        assert code == body.decode()
+        assert isinstance(lexer, JsonLexer)
+
+
+def test_format_response_oversized_json():
+    with given:
+        body = b'{"items": [' + b"1," * (512 * 1024) + b"1]}"
+        response = Response(status_code=200, content=body, headers={
+            "Content-Type": "application/json"
+        })
+
+    with when:
+        code, lexer = format_response_body(response)
+
+    with then:
+        assert code == body[:1024 * 1024].decode() + f"… [truncated to {1024 * 1024} bytes]"
+        assert isinstance(lexer, TextLexer)
+
+
+def test_format_response_non_json_body():
+    with given:
+        body = b'<html>Bad Gateway</html>'
+        response = Response(status_code=502, content=body, headers={
+            "Content-Type": "application/json"
+        })
+
+    with when:
+        code, lexer = format_response_body(response)
+
+    with then:
+        assert code == '<html>Bad Gateway</html>'
+        assert isinstance(lexer, TextLexer)
+
+
 def test_render_response():
     with given:
         body = b'{"id": 1}'
@@ -130,7 +337,7 @@ def test_render_response():
         assert text == "Response:"
 
         assert isinstance(http_syntax, Syntax)
-        assert http_syntax.code == linesep.join([
+        assert http_syntax.code == "\n".join([
             "HTTP/1.1 200 OK",
             "content-type: application/json",
             "content-length: 9",
@@ -67,6 +67,22 @@ async def test_arg_parsed_enabled(*, dispatcher: Dispatcher, request_recorder_:
         assert request_recorder_.mock_calls == [call.enable()]
 
 
+async def test_arg_parsed_enabled_max_body_bytes(*, dispatcher: Dispatcher,
+                                                 request_recorder_: Mock):
+    with given:
+        class HTTPXConfig(VedroHTTPX):
+            max_body_bytes = 1024
+
+        plugin = VedroHTTPXPlugin(HTTPXConfig, request_recorder=request_recorder_)
+        plugin.subscribe(dispatcher)
+
+    with when:
+        await fire_arg_parsed_event(dispatcher, httpx_record_requests=True)
+
+    with then:
+        assert request_recorder_.mock_calls == [call.set_max_body_bytes(1024), call.enable()]
+
+
 @pytest.mark.usefixtures(httpx_plugin.__name__)
 async def test_scenario_run_disabled(*, dispatcher: Dispatcher, request_recorder_: Mock):
     with given:
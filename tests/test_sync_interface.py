@@ -1,21 +1,30 @@
+from threading import Thread
+from typing import Any
 from unittest.mock import Mock, call
 
 from baby_steps import given, then, when
 from httpx import MockTransport
 from vedro import Interface
 
-from vedro_httpx import SyncHTTPInterface
+from vedro_httpx import SyncClient, SyncHTTPInterface
+from vedro_httpx.recorder import RequestRecorder
 
 from ._utils import (
     RouterType,
+    async_formatter,
     build_url,
+    builder,
+    request_recorder,
     request_recorder_,
     respx_mock,
+    sync_formatter,
     sync_http_interface,
     sync_transport,
 )
 
-__all__ = ("sync_transport", "respx_mock", "request_recorder_", "sync_http_interface",)  # fixtures
+__all__ = ("builder", "sync_formatter", "async_formatter", "request_recorder",
+           "sync_transport", "respx_mock", "request_recorder_",
+           "sync_http_interface",)  # fixtures
 
 
 def test_sync_interface():
@@ -54,4 +63,105 @@ def test_sync_request_recorder(*, sync_http_interface: SyncHTTPInterface, reques
 
     with then:
         assert response.status_code == 200
-        assert request_recorder_.mock_calls == [call.sync_record(response)]
+        assert request_recorder_.mock_calls == [
+            call.is_enabled(),
+            call.sync_record(response),
+        ]
+
+
+def test_sync_client_reused(*, sync_http_interface: SyncHTTPInterface):
+    with given:
+        client = sync_http_interface._get_client()
+
+    with when:
+        res = sync_http_interface._get_client()
+
+    with then:
+        assert res is client
+        assert not client.is_closed
+
+
+def test_sync_client_per_thread(*, sync_http_interface: SyncHTTPInterface):
+    with given:
+        client = sync_http_interface._get_client()
+        clients = []
+
+    with when:
+        thread = Thread(target=lambda: clients.append(sync_http_interface._get_client()))
+        thread.start()
+        thread.join()
+
+    with then:
+        assert len(clients) == 1
+        assert clients[0] is not client
+
+
+def test_sync_request_cookies_not_shared(*, request_recorder_: Mock,
+                                         sync_transport: MockTransport, respx_mock: RouterType):
+    with given:
+        class CustomInterface(SyncHTTPInterface):
+            def _client(self, **kwargs: Any) -> SyncClient:
+                return super()._client(transport=sync_transport, **kwargs)
+
+        sync_http_interface = CustomInterface(base_url=build_url(),
+                                              request_recorder=request_recorder_)
+
+        respx_mock.get("/login").respond(200, headers={"Set-Cookie": "session=1"})
+        route = respx_mock.get("/profile").respond(200)
+        sync_http_interface._request("GET", "/login")
+
+    with when:
+        sync_http_interface._request("GET", "/profile")
+
+    with then:
+        assert "cookie" not in route.calls.last.request.headers
+
+
+def test_sync_request_client_cookies_kept(*, request_recorder_: Mock,
+                                          sync_transport: MockTransport, respx_mock: RouterType):
+    with given:
+        class CustomInterface(SyncHTTPInterface):
+            def _client(self, **kwargs: Any) -> SyncClient:
+                return super()._client(transport=sync_transport, cookies={"auth": "t"}, **kwargs)
+
+        sync_http_interface = CustomInterface(base_url=build_url(),
+                                              request_recorder=request_recorder_)
+
+        respx_mock.get("/login").respond(200, headers={"Set-Cookie": "session=1"})
+        route = respx_mock.get("/profile").respond(200)
+        sync_http_interface._request("GET", "/login")
+
+    with when:
+        sync_http_interface._request("GET", "/profile")
+
+    with then:
+        assert respx_mock.calls[0].request.headers["cookie"] == "auth=t"
+        assert route.calls.last.request.headers["cookie"] == "auth=t"
+
+
+def test_sync_client_started_at(*, request_recorder: RequestRecorder,
+                                sync_transport: MockTransport, respx_mock: RouterType):
+    with given:
+        request_recorder.enable()
+        client = SyncClient(transport=sync_transport, request_recorder=request_recorder)
+        respx_mock.get("/").respond(200)
+
+    with when:
+        response = client.get(build_url())
+
+    with then:
+        assert "vedro_httpx_started_at_wall_ns" in response.request.extensions
+
+
+def test_sync_client_started_at_recorder_disabled(*, request_recorder: RequestRecorder,
+                                                  sync_transport: MockTransport,
+                                                  respx_mock: RouterType):
+    with given:
+        client = SyncClient(transport=sync_transport, request_recorder=request_recorder)
+        respx_mock.get("/").respond(200)
+
+    with when:
+        response = client.get(build_url())
+
+    with then:
+        assert "vedro_httpx_started_at_wall_ns" not in response.request.extensions
@@ -1,4 +1,4 @@
-from datetime import datetime
+from time import perf_counter_ns, time_ns
 from typing import Any, Dict, Optional, Union, cast
 
 import vedro
@@ -32,6 +32,19 @@ class AsyncClient(_AsyncClient):
     which supports rendering in rich console environments.
     """
 
+    def __init__(self, *args: Any, request_recorder: Optional[RequestRecorder] = None,
+                 **kwargs: Any) -> None:
+        """
+        Initialize the AsyncClient with an optional request recorder.
+
+        :param args: Positional arguments passed to httpx.AsyncClient.
+        :param request_recorder: The recorder that receives this client's responses. When set,
+                                 requests are timestamped only while the recorder is enabled.
+        :param kwargs: Keyword arguments passed to httpx.AsyncClient.
+        """
+        super().__init__(*args, **kwargs)
+        self._request_recorder = request_recorder
+
     async def _send_single_request(self, request: Request) -> Response:
         """
         Send an HTTP request asynchronously and return an enhanced response object.
@@ -39,7 +52,10 @@ class AsyncClient(_AsyncClient):
         :param request: The HTTP request object to be sent.
         :return: An enhanced Response object containing the HTTP response data.
         """
-        request.extensions["vedro_httpx_started_at"] = datetime.now()
+        # The start time is only needed to build HAR entries
+        if self._request_recorder is None or self._request_recorder.is_enabled():
+            request.extensions["vedro_httpx_started_at_wall_ns"] = time_ns()
+            request.extensions["vedro_httpx_started_at_ns"] = perf_counter_ns()
 
         response = await super()._send_single_request(request)
 
@@ -83,7 +99,7 @@ class AsyncHTTPInterface(vedro.Interface):
         :return: An instance of `SyncClient` configured with a base URL and response hooks.
         """
         base_url = kwargs.pop("base_url", self._base_url)
-        client = AsyncClient(base_url=base_url, **kwargs)
+        client = AsyncClient(base_url=base_url, request_recorder=self._request_recorder, **kwargs)
         client.event_hooks["response"].append(self._request_recorder.async_record)
         return client
 
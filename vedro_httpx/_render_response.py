@@ -1,21 +1,90 @@
+import codecs
 import json
-import os
-from typing import Any, Optional, Tuple, Union
+import re
+from functools import lru_cache
+from itertools import chain
+from typing import Any, Dict, List, Optional, Tuple, Union
 
-from httpx import Response
+from httpx import Headers, Response
 from pygments.lexer import Lexer
-from pygments.lexers import HttpLexer, JsonLexer, TextLexer, get_lexer_for_mimetype
+from pygments.lexers import JsonLexer, TextLexer, get_lexer_for_mimetype
 from pygments.util import ClassNotFound
-from rich.console import RenderResult
-from rich.syntax import Syntax
+from rich.console import RenderableType
+from rich.syntax import Syntax, SyntaxTheme
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    _HAS_ORJSON = False
+else:
+    _HAS_ORJSON = True
 
 __all__ = ("render_response",)
 
+# Bodies larger than this are never decoded in full, only a prefix of this size is rendered
+_MAX_BODY_SIZE = 1024 * 1024
+_TRUNCATION_MARKER = f"… [truncated to {_MAX_BODY_SIZE} bytes]"
+# JSON bodies larger than this are shown as received, without being parsed and re-indented
+_MAX_JSON_PARSE_SIZE = 256 * 1024
+
+_TEXTUAL_MIME_PREFIXES = ("text/", "application/json", "application/xml")
+
+# Syntax options that do not depend on the rendered response
+_HEADERS_SYNTAX_OPTIONS: Dict[str, Any] = {"word_wrap": True}
+_BODY_SYNTAX_OPTIONS: Dict[str, Any] = {"word_wrap": True, "indent_guides": True}
+
+# Characters a JSON document can start with (object, array, string, number, true, false, null)
+_JSON_START_CHARS = frozenset('{["-0123456789tfn')
+
+# orjson only supports a two-space indent, each leading space is doubled to get four
+_INDENT_RE = re.compile(r"^( +)", re.MULTILINE)
+
+# get_lexer_for_mimetype scans the whole Pygments registry, so its results (None when no lexer
+# handles a MIME type) are cached per MIME type
+_LEXER_INSTANCES: Dict[str, Optional[Lexer]] = {}
+
+_TEXT_LEXER = TextLexer()
+
+
+@lru_cache(maxsize=None)
+def _get_http_lexer() -> Lexer:
+    """
+    Create the lexer used for response headers on first use.
+
+    Pygments compiles the rules of a lexer when it is first instantiated, so lexers are created
+    lazily rather than when the plugin is imported.
+
+    :return: The shared HttpLexer instance.
+    """
+    from pygments.lexers.textfmts import HttpLexer
+    return HttpLexer()
+
+
+@lru_cache(maxsize=None)
+def _get_fast_lexers() -> Dict[str, Lexer]:
+    """
+    Create lexers for the content types most commonly seen in HTTP APIs on first use.
+
+    These are resolved by a plain dictionary lookup, without going through the Pygments registry.
+
+    :return: A dictionary mapping MIME types to shared lexer instances.
+    """
+    from pygments.lexers.html import HtmlLexer, UrlEncodedLexer, XmlLexer
+    xml_lexer = XmlLexer()
+    return {
+        "application/json": JsonLexer(),
+        "application/x-www-form-urlencoded": UrlEncodedLexer(),
+        "application/xml": xml_lexer,
+        "text/html": HtmlLexer(),
+        "text/plain": _TEXT_LEXER,
+        "text/xml": xml_lexer,
+    }
+
 
 def render_response(response: Response, *,
-                    theme: str = "ansi_dark", width: Optional[int] = None) -> RenderResult:
+                    theme: str = "ansi_dark", width: Optional[int] = None) -> List[RenderableType]:
     """
-    Yield formatted sections of an HTTP response for rendering in a rich console.
+    Build formatted sections of an HTTP response for rendering in a rich console.
 
     This function creates visually appealing and structured representations of HTTP response
     headers and body using syntax highlighting. It automatically selects appropriate lexers for
@@ -24,15 +93,35 @@ def render_response(response: Response, *,
     :param response: The HTTP response object from httpx to render.
     :param theme: The color theme to use for syntax highlighting (default 'ansi_dark').
     :param width: The maximum width for the code blocks. If not set, defaults to console width.
-    :return: Yields formatted rich syntax objects for headers and body.
+    :return: A list of renderables: a title followed by rich syntax objects for headers and body.
     """
-    yield "Response:"
-    headers, http_lexer = format_response_headers(response)
-    yield Syntax(headers, http_lexer, theme=theme, word_wrap=True, code_width=width)
+    headers_options, body_options = _get_syntax_options(theme)
 
+    headers, http_lexer = format_response_headers(response)
     body, lexer = format_response_body(response)
-    yield Syntax(body, lexer,
-                 theme=theme, word_wrap=True, indent_guides=True, code_width=width)
+    return [
+        "Response:",
+        Syntax(headers, http_lexer, code_width=width, **headers_options),
+        Syntax(body, lexer, code_width=width, **body_options),
+    ]
+
+
+@lru_cache(maxsize=None)
+def _get_syntax_options(theme: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    Build the Syntax keyword arguments for the headers and the body for a given theme.
+
+    Rich builds a new theme (along with its style table) for every Syntax object created with
+    a theme name, so the theme is resolved once and shared by both sets of options.
+
+    :param theme: The name of the color theme.
+    :return: A tuple of keyword arguments for the headers Syntax and the body Syntax.
+    """
+    syntax_theme: SyntaxTheme = Syntax.get_theme(theme)
+    return (
+        {"theme": syntax_theme, **_HEADERS_SYNTAX_OPTIONS},
+        {"theme": syntax_theme, **_BODY_SYNTAX_OPTIONS},
+    )
 
 
 def format_response_headers(response: Response) -> Tuple[str, Lexer]:
@@ -44,13 +133,133 @@ def format_response_headers(response: Response) -> Tuple[str, Lexer]:
     :return: A tuple containing the formatted headers as a string and the corresponding
              HttpLexer instance.
     """
-    lines = [f"{response.http_version} {response.status_code} {response.reason_phrase}"]
-    for header in response.headers:
-        values = response.headers.get_list(header)
-        for value in values:
-            lines.append(f"{header}: {value}")
+    status_line = _build_status_line(response.http_version, response.status_code,
+                                     response.reason_phrase)
+    # Enhanced responses cache their formatted header lines, plain httpx responses do not
+    header_lines = getattr(response, "_rendered_headers", None)
+    if header_lines is None:
+        header_lines = _format_header_lines(response.headers)
+
+    lines = chain((status_line,), header_lines)
+    return "\n".join(lines), _get_http_lexer()
+
+
+def _format_header_lines(headers: Headers) -> List[str]:
+    """
+    Format HTTP headers into lines, one line per header value, in the order they were received.
+
+    :param headers: The HTTP headers to format.
+    :return: A list of lines in the "name: value" form.
+    """
+    return [f"{name}: {value}" for name, value in headers.multi_items()]
+
+
+def _extract_mime_type(content_type: str) -> str:
+    """
+    Extract the MIME type from a Content-Type header value, dropping any parameters.
+
+    :param content_type: The Content-Type header value (e.g., 'text/html; charset=utf-8').
+    :return: The MIME type without parameters or surrounding whitespace.
+    """
+    mime_type, _, _ = content_type.partition(";")
+    return mime_type.strip()
+
+
+@lru_cache(maxsize=64)
+def _normalize_encoding(encoding: str) -> str:
+    """
+    Resolve an encoding name to its canonical codec name.
+
+    :param encoding: The encoding name, as declared by the response.
+    :return: The canonical codec name, or 'utf-8' if the encoding is unknown.
+    """
+    try:
+        return codecs.lookup(encoding).name
+    except LookupError:
+        return "utf-8"
+
+
+def _is_indented_json(code: str) -> bool:
+    """
+    Check whether JSON text appears to be pretty-printed already.
+
+    Only the beginning of the text is inspected, so the check stays cheap for large bodies.
+
+    :param code: The JSON text to check.
+    :return: True if the text starts with an object or array followed by indented lines.
+    """
+    head = code[:200]
+    return head.lstrip().startswith(("{", "[")) and ("\n " in head or "\n\t" in head)
+
+
+def _lookup_lexer(mime_type: str) -> Optional[Lexer]:
+    """
+    Find a lexer for the given MIME type, reusing previously created lexer instances.
+
+    :param mime_type: The MIME type to find a lexer for.
+    :return: A lexer instance, or None if no lexer handles the MIME type.
+    """
+    if mime_type not in _LEXER_INSTANCES:
+        try:
+            lexer: Optional[Lexer] = get_lexer_for_mimetype(mime_type)
+        except ClassNotFound:
+            lexer = None
+        _LEXER_INSTANCES[mime_type] = lexer
+    return _LEXER_INSTANCES[mime_type]
+
+
+def _parse_json(response: Response) -> Tuple[Any, bool]:
+    """
+    Parse the JSON body of a response, noting whether it contains non-finite numbers.
 
-    return os.linesep.join(lines), HttpLexer()
+    :param response: The HTTP response whose body is to be parsed.
+    :return: A tuple containing the parsed value and whether NaN, Infinity or -Infinity occurred.
+    """
+    constants: List[str] = []
+
+    def parse_constant(constant: str) -> float:
+        constants.append(constant)
+        return float(constant)
+
+    return response.json(parse_constant=parse_constant), bool(constants)
+
+
+def _dump_json(value: Any, *, has_non_finite: bool = False) -> str:
+    """
+    Serialize a parsed JSON value with a four-space indent.
+
+    orjson is used when it is installed, as the standard library encoder falls back to pure
+    Python once an indent is requested. Values orjson cannot encode (e.g. integers beyond
+    64 bits) are serialized by the standard library instead, and so are documents with
+    non-finite numbers, which orjson would silently write as null.
+
+    :param value: The parsed JSON value to serialize.
+    :param has_non_finite: Whether the value contains NaN, Infinity or -Infinity.
+    :return: The indented JSON text.
+    """
+    if _HAS_ORJSON and not has_non_finite:
+        try:
+            dumped = orjson.dumps(value, option=orjson.OPT_INDENT_2).decode()
+        except TypeError:
+            pass
+        else:
+            return _INDENT_RE.sub(r"\1\1", dumped)
+    return json.dumps(value, indent=4, ensure_ascii=False)
+
+
+@lru_cache(maxsize=256)
+def _build_status_line(http_version: str, status_code: int, reason_phrase: str) -> str:
+    """
+    Build the status line of an HTTP response.
+
+    The result is cached as only a handful of distinct status lines occur in practice.
+
+    :param http_version: The HTTP version of the response (e.g., 'HTTP/1.1').
+    :param status_code: The HTTP status code of the response.
+    :param reason_phrase: The reason phrase accompanying the status code.
+    :return: The status line as a string.
+    """
+    return "".join((http_version, " ", str(status_code), " ", reason_phrase))
 
 
 def format_response_body(response: Response) -> Tuple[Any, Union[Lexer, str]]:
@@ -65,18 +274,39 @@ def format_response_body(response: Response) -> Tuple[Any, Union[Lexer, str]]:
              and the lexer to use for syntax highlighting, or an empty string if no suitable
              lexer is found.
     """
-    content_type = response.headers.get("Content-Type", "")
-    mime_type, *_ = content_type.split(";")
-    try:
-        lexer = get_lexer_for_mimetype(mime_type.strip())
-    except ClassNotFound:
-        preview = response.content[:10]
-        return f"<binary preview={preview!r} len={len(response.content)}>", ""
+    mime_type = _extract_mime_type(response.headers.get("Content-Type", ""))
+
+    content = response.content
+    is_oversized = len(content) > _MAX_BODY_SIZE
+    if is_oversized and not mime_type.startswith(_TEXTUAL_MIME_PREFIXES):
+        return f"<binary preview={content[:10]!r} len={len(content)}>", ""
+
+    lexer = _get_fast_lexers().get(mime_type)
+    if lexer is None:
+        lexer = _lookup_lexer(mime_type)
+    if lexer is None:
+        return f"<binary preview={content[:10]!r} len={len(content)}>", ""
+
+    encoding = _normalize_encoding(response.encoding or "utf-8")
+    if is_oversized:
+        code = content[:_MAX_BODY_SIZE].decode(encoding, errors="replace")
+        code += _TRUNCATION_MARKER
+        # A truncated document is no longer valid JSON, so it is neither parsed nor re-indented
+        if isinstance(lexer, JsonLexer):
+            return code, _TEXT_LEXER
+    else:
+        code = content.decode(encoding, errors="replace")
 
-    code = response.text
     if isinstance(lexer, JsonLexer):
+        if len(content) > _MAX_JSON_PARSE_SIZE or _is_indented_json(code):
+            return code, lexer
+        # Reject bodies that cannot be JSON by their first character before attempting to parse.
+        # The utf-8 codec keeps a byte order mark, which response.json() skips
+        if code.lstrip("\ufeff").lstrip()[:1] not in _JSON_START_CHARS:
+            return code, _TEXT_LEXER
         try:
-            code = json.dumps(response.json(), indent=4)
-        except Exception:
-            return code, TextLexer()
+            value, has_non_finite = _parse_json(response)
+            code = _dump_json(value, has_non_finite=has_non_finite)
+        except (ValueError, RecursionError):
+            return code, _TEXT_LEXER
     return code, lexer
@@ -1,10 +1,16 @@
+from functools import cached_property
+from typing import List
+
 from httpx import Response as _Response
 from rich.console import Console, ConsoleOptions, RenderResult
 
-from ._render_response import render_response
+from ._render_response import _format_header_lines, render_response
 
 __all__ = ("Response",)
 
+# Large default width of 1024^2 (which practically means no width limit)
+_DEFAULT_WIDTH = 1024 ** 2
+
 
 class Response(_Response):
     """
@@ -26,6 +32,15 @@ class Response(_Response):
         """
         # Check if a specific width limit has been set. If options.min_width and options.max_width
         # are the same, then a specific width limit has been set and we use options.max_width.
-        # If not, we use a large default width of 1024^2 (which practically means no width limit).
-        width = options.max_width if options.min_width == options.max_width else 1024 ** 2
+        # If not, we use a large default width (which practically means no width limit).
+        width = options.max_width if options.min_width == options.max_width else _DEFAULT_WIDTH
         yield from render_response(self, width=width)
+
+    @cached_property
+    def _rendered_headers(self) -> List[str]:
+        """
+        Format the header lines of this response once and reuse them across renders.
+
+        :return: A list of header lines in the "name: value" form.
+        """
+        return _format_header_lines(self.headers)
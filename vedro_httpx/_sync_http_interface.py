@@ -1,9 +1,11 @@
-from datetime import datetime
+import threading
+import weakref
+from time import perf_counter_ns, time_ns
 from typing import Any, Dict, Optional, Union, cast
 
 import vedro
 from httpx import Client as _SyncClient
-from httpx import Request
+from httpx import Cookies, Request
 from httpx._client import USE_CLIENT_DEFAULT, UseClientDefault
 from httpx._types import (
     AuthTypes,
@@ -32,6 +34,19 @@ class SyncClient(_SyncClient):
     which supports rendering in rich console environments.
     """
 
+    def __init__(self, *args: Any, request_recorder: Optional[RequestRecorder] = None,
+                 **kwargs: Any) -> None:
+        """
+        Initialize the SyncClient with an optional request recorder.
+
+        :param args: Positional arguments passed to httpx.Client.
+        :param request_recorder: The recorder that receives this client's responses. When set,
+                                 requests are timestamped only while the recorder is enabled.
+        :param kwargs: Keyword arguments passed to httpx.Client.
+        """
+        super().__init__(*args, **kwargs)
+        self._request_recorder = request_recorder
+
     def _send_single_request(self, request: Request) -> Response:
         """
         Send an HTTP request synchronously and return an enhanced response object.
@@ -39,7 +54,10 @@ class SyncClient(_SyncClient):
         :param request: The HTTP request object to be sent.
         :return: An enhanced Response object containing the HTTP response data.
         """
-        request.extensions["vedro_httpx_started_at"] = datetime.now()
+        # The start time is only needed to build HAR entries
+        if self._request_recorder is None or self._request_recorder.is_enabled():
+            request.extensions["vedro_httpx_started_at_wall_ns"] = time_ns()
+            request.extensions["vedro_httpx_started_at_ns"] = perf_counter_ns()
 
         response = super()._send_single_request(request)
         return Response(
@@ -72,6 +90,8 @@ class SyncHTTPInterface(vedro.Interface):
         super().__init__()
         self._base_url = base_url
         self._request_recorder = request_recorder
+        # Each thread gets its own client, so requests never share a cookie jar across threads
+        self._local = threading.local()
 
     def _client(self, **kwargs: Any) -> SyncClient:
         """
@@ -82,10 +102,33 @@ class SyncHTTPInterface(vedro.Interface):
         :return: An instance of `SyncClient` configured with a base URL and response hooks.
         """
         base_url = kwargs.pop("base_url", self._base_url)
-        client = SyncClient(base_url=base_url, **kwargs)
+        client = SyncClient(base_url=base_url, request_recorder=self._request_recorder, **kwargs)
         client.event_hooks["response"].append(self._request_recorder.sync_record)
         return client
 
+    def _get_client(self) -> SyncClient:
+        """
+        Return the client used by the requests of this interface in the current thread.
+
+        Reusing one client keeps its connection pool, so keep-alive connections (and TLS
+        sessions) survive between requests. The client is closed when the interface is
+        garbage-collected or at interpreter exit. The cookies the client is configured with
+        (e.g. by a `_client()` override) are saved, so they can be restored before each request.
+
+        `_client()` is called only once per thread, on first use. Anything a `_client()` override
+        computes (e.g. a fresh auth header) is therefore fixed for the lifetime of that client;
+        values that must change between requests have to be passed to each request instead.
+
+        :return: The instance of `SyncClient` for the current thread.
+        """
+        client: Optional[SyncClient] = getattr(self._local, "client", None)
+        if client is None:
+            client = self._client()
+            self._local.client = client
+            self._local.cookies = Cookies(client.cookies)
+            weakref.finalize(self, client.close)
+        return client
+
     def _request(self,
                  method: str,
                  url: URLTypes,
@@ -136,19 +179,22 @@ class SyncHTTPInterface(vedro.Interface):
             extensions["vedro_httpx_parameterized_url"] = parameterized_url
             url = str(url).format(**segments)
 
-        with self._client() as client:
-            return cast(Response, client.request(
-                method=method,
-                url=url,
-                content=content,
-                data=data,
-                files=files,
-                json=json,
-                params=params,
-                headers=headers,
-                auth=auth,
-                follow_redirects=follow_redirects,
-                timeout=timeout,
-                extensions=extensions,
-                **kwargs
-            ))
+        client = self._get_client()
+        # Cookies set by earlier responses must not leak into unrelated requests, so the client
+        # gets a fresh copy of the cookies it was created with
+        client.cookies = self._local.cookies
+        return cast(Response, client.request(
+            method=method,
+            url=url,
+            content=content,
+            data=data,
+            files=files,
+            json=json,
+            params=params,
+            headers=headers,
+            auth=auth,
+            follow_redirects=follow_redirects,
+            timeout=timeout,
+            extensions=extensions,
+            **kwargs
+        ))
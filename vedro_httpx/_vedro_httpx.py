@@ -1,4 +1,5 @@
-from typing import Type, Union
+import asyncio
+from typing import Optional, Type, Union
 
 from vedro import FileArtifact, create_tmp_file
 from vedro.core import Dispatcher, Plugin, PluginConfig
@@ -23,6 +24,7 @@ class VedroHTTPXPlugin(Plugin):
         self._request_recorder = request_recorder
         self._record_requests = config.record_requests
         self._requests_artifact_name = config.requests_artifact_name
+        self._max_body_bytes = config.max_body_bytes
 
     def subscribe(self, dispatcher: Dispatcher) -> None:
         dispatcher.listen(ArgParseEvent, self.on_arg_parse) \
@@ -41,9 +43,11 @@ class VedroHTTPXPlugin(Plugin):
     def on_arg_parsed(self, event: ArgParsedEvent) -> None:
         self._record_requests = event.args.httpx_record_requests
         if self._record_requests:
+            if self._max_body_bytes is not None:
+                self._request_recorder.set_max_body_bytes(self._max_body_bytes)
             self._request_recorder.enable()
 
-    async def on_scenario_run(self, event: ScenarioRunEvent) -> None:
+    def on_scenario_run(self, event: ScenarioRunEvent) -> None:
         if self._record_requests:
             self._request_recorder.reset()
 
@@ -51,7 +55,9 @@ class VedroHTTPXPlugin(Plugin):
                               event: Union[ScenarioPassedEvent, ScenarioFailedEvent]) -> None:
         if self._record_requests:
             tmp_file = create_tmp_file(suffix=".har")
-            self._request_recorder.save(tmp_file)
+            # Encoding and writing the HAR file is blocking, keep it off the event loop
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self._request_recorder.save, tmp_file)
 
             artifact = FileArtifact(self._requests_artifact_name, "application/json", tmp_file)
             event.scenario_result.attach(artifact)
@@ -67,3 +73,7 @@ class VedroHTTPX(PluginConfig):
 
     # Artifact file name for recorded HTTP requests
     requests_artifact_name: str = "httpx-requests.har"
+
+    # Maximum size of a recorded response body in bytes
+    # Larger bodies are replaced by a comment in the HAR entry (None records every body)
+    max_body_bytes: Optional[int] = None
@@ -1,3 +1,4 @@
+import asyncio
 from typing import List
 
 import httpx
@@ -8,6 +9,9 @@ from ._base_har_formatter import BaseHARFormatter
 
 __all__ = ("AsyncHARFormatter",)
 
+# The maximum number of entries formatted at once, which bounds how many body reads run together
+_MAX_CONCURRENT_ENTRIES = 32
+
 
 class AsyncHARFormatter(BaseHARFormatter):
     """
@@ -17,22 +21,38 @@ class AsyncHARFormatter(BaseHARFormatter):
     and response data into the standardized HAR format.
     """
 
+    __slots__ = ()
+
     async def format(self, responses: List[httpx.Response]) -> har.Log:
         """
         Create a HAR log from a list of HTTP responses.
 
-        Iterates over each response, formats it along with its corresponding request into a HAR
-        entry, and then compiles these entries into a HAR log.
+        Formats each response along with its corresponding request into a HAR entry
+        concurrently, so that pending body reads overlap, and then compiles these entries (in
+        the original order) into a HAR log. At most `_MAX_CONCURRENT_ENTRIES` entries are
+        formatted at once, which limits how many body reads run concurrently. It does not bound
+        memory: each body read is cached on its response, which the caller keeps alive.
 
         :param responses: A list of httpx.Response objects to be formatted.
         :return: A HAR log dictionary that encapsulates all the formatted entries.
         """
-        entries = []
-        for response in responses:
-            entry = await self.format_entry(response, response.request)
-            entries.append(entry)
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENT_ENTRIES)
+        entries = await asyncio.gather(*(
+            self._format_entry_bounded(response, semaphore) for response in responses
+        ))
+        return self._builder.build_log(list(entries))
+
+    async def _format_entry_bounded(self, response: httpx.Response,
+                                    semaphore: asyncio.Semaphore) -> har.Entry:
+        """
+        Format a single HTTP response into a HAR entry once the semaphore is acquired.
 
-        return self._builder.build_log(entries)
+        :param response: The httpx.Response object to format.
+        :param semaphore: The semaphore limiting the number of entries formatted at once.
+        :return: A HAR entry dictionary encapsulating the formatted request and response.
+        """
+        async with semaphore:
+            return await self.format_entry(response, response.request)
 
     async def format_entry(self, response: httpx.Response, request: httpx.Request) -> har.Entry:
         """
@@ -61,21 +81,33 @@ class AsyncHARFormatter(BaseHARFormatter):
         :param http_version: The HTTP version to use in the formatting (default "HTTP/1.1").
         :return: A HAR request dictionary.
         """
-        if content := await request.aread():
+        post_data = None
+        try:
+            # Buffered bodies are used as is, without going through aread()
+            content = request.content
+        except httpx.RequestNotRead:
+            try:
+                content = await request.aread()
+            except httpx.StreamConsumed:
+                content = b""
+                content_type = self._get_content_type(request.headers)
+                post_data = self._builder.build_post_data(content_type, "(stream)",
+                                                          comment="Stream consumed")
+        if content:
             content_type = self._get_content_type(request.headers)
             post_data = self._format_request_post_data(content, content_type)
-        else:
-            post_data = None
 
         parameterized_url = request.extensions.get("vedro_httpx_parameterized_url", None)
+        headers, cookies = self._format_headers(request.headers, "cookie")
+        url = request.url
 
         return self._builder.build_request(
             method=request.method,
-            url=str(request.url),
+            url=str(url),
             http_version=http_version,
-            query_string=self._format_query_params(request.url.params),
-            headers=self._format_headers(request.headers),
-            cookies=self._format_cookies(self._get_request_cookies(request.headers)),
+            query_string=self._format_query_params(url.params),
+            headers=headers,
+            cookies=self._format_cookies(cookies) if cookies else [],
             post_data=post_data,
             parameterized_url=parameterized_url,
         )
@@ -87,12 +119,13 @@ class AsyncHARFormatter(BaseHARFormatter):
         :param response: The httpx.Response object to format.
         :return: A HAR response dictionary encapsulating the formatted response details.
         """
+        headers, cookies = self._format_headers(response.headers, "set-cookie")
         return self._builder.build_response(
             status=response.status_code,
             status_text=response.reason_phrase,
             http_version=response.http_version,
-            cookies=self._format_cookies(self._get_response_cookies(response.headers)),
-            headers=self._format_headers(response.headers),
+            cookies=self._format_cookies(cookies) if cookies else [],
+            headers=headers,
             content=await self.format_response_content(response),
             redirect_url=self._get_location_header(response.headers),
         )
@@ -105,9 +138,16 @@ class AsyncHARFormatter(BaseHARFormatter):
         :return: A HAR content dictionary.
         """
         content_type = self._get_content_type(response.headers)
+        if oversized := self._format_declared_oversized_content(response, content_type):
+            return oversized
         try:
-            content = await response.aread()
-        except httpx.StreamConsumed:
-            return self._builder.build_response_content(content_type, size=0, text="(stream)",
-                                                        comment="Stream consumed")
+            # Buffered bodies are used as is, without going through aread()
+            content = response.content
+        except httpx.ResponseNotRead:
+            try:
+                content = await response.aread()
+            except httpx.StreamConsumed:
+                return self._builder.build_response_content(content_type, size=0,
+                                                            text="(stream)",
+                                                            comment="Stream consumed")
         return self._format_response_content(content, content_type)
@@ -1,12 +1,14 @@
+import re
 from base64 import b64encode
+from binascii import Error as BinasciiError
+from binascii import a2b_base64, a2b_qp
 from datetime import datetime
-from email.message import EmailMessage, Message
-from email.parser import Parser
-from email.policy import HTTP as HTTPPolicy
 from email.utils import parsedate_to_datetime
-from http.cookies import Morsel, SimpleCookie
-from typing import Any, List, Tuple, Union, cast
-from urllib.parse import parse_qsl
+from functools import lru_cache
+from itertools import starmap
+from time import perf_counter_ns
+from typing import Dict, List, Optional, Tuple, Union
+from urllib.parse import unquote, unquote_plus
 
 import httpx
 
@@ -14,8 +16,75 @@ import vedro_httpx.recorder.har as har
 
 from ._har_builder import HARBuilder
 
+try:
+    import pybase64
+except ImportError:  # pragma: no cover
+    _HAS_PYBASE64 = False
+else:
+    _HAS_PYBASE64 = True
+
 __all__ = ("BaseHARFormatter",)
 
+# text/*, application/json, application/xml and structured syntax suffixes (e.g. +json, +xml),
+# matched case-insensitively as media types are
+_TEXT_CONTENT_RE = re.compile(
+    r"text/|application/(?:json|xml)|[^/;\s]+/[^;\s]+\+(?:json|xml)(?![^;\s])", re.IGNORECASE
+)
+# Attribute names that Set-Cookie headers may carry after the cookie itself
+_COOKIE_ATTRIBUTES = frozenset(("expires", "path", "comment", "domain", "max-age", "secure",
+                                "httponly", "version", "samesite"))
+# A name with an optional value, which is either a quoted string (that may contain ';') or a token
+_COOKIE_PAIR_RE = re.compile(
+    r'\s*([^=;\s][^=;]*?)\s*(?:=\s*("(?:[^"\\]|\\.)*"|[^;]*?))?\s*(?:;|$)'
+)
+# Backslash escapes of quoted cookie values: three octal digits or any single character
+_COOKIE_ESCAPE_RE = re.compile(r"\\(?:([0-3][0-7][0-7])|(.))")
+_MULTIPART_BOUNDARY_RE = re.compile(r'boundary=(?:"([^"]+)"|([^;\s]+))', re.IGNORECASE)
+# A single parameter of a Content-Disposition header, either quoted or a plain token
+_DISPOSITION_PARAM_RE = re.compile(r';\s*([^\s=;]+)\s*=\s*(?:"((?:[^"\\]|\\.)*)"|([^;\s]*))')
+_QUOTED_PAIR_RE = re.compile(r"\\(.)")
+
+
+def _unquote_cookie_value(value: str) -> str:
+    """
+    Remove the quotes of a quoted cookie value and decode its escapes, as SimpleCookie does.
+
+    :param value: The cookie value, possibly quoted.
+    :return: The unquoted value, or the value as is if it is not quoted.
+    """
+    if len(value) < 2 or value[0] != '"' or value[-1] != '"':
+        return value
+    return _COOKIE_ESCAPE_RE.sub(
+        lambda match: chr(int(match.group(1), 8)) if match.group(1) else match.group(2),
+        value[1:-1]
+    )
+
+
+@lru_cache(maxsize=1024)
+def _parse_cookie_expires(expires: str) -> str:
+    """
+    Convert a cookie Expires date into an ISO 8601 string.
+
+    Responses often repeat the same expiry across cookies, so parsed dates are cached.
+
+    :param expires: The Expires attribute value in RFC 2822 date format.
+    :return: The date in ISO 8601 format.
+    """
+    return parsedate_to_datetime(expires).isoformat()
+
+
+@lru_cache(maxsize=512)
+def _is_text_content_type(content_type: str) -> bool:
+    """
+    Determine if the given content type is text-based.
+
+    Traffic repeats a handful of content types, so the classification is cached per value.
+
+    :param content_type: The content type to evaluate.
+    :return: True if the content type is text-based, otherwise False.
+    """
+    return _TEXT_CONTENT_RE.match(content_type) is not None
+
 
 class BaseHARFormatter:
     """
@@ -25,37 +94,75 @@ class BaseHARFormatter:
     components of the HAR file, such as requests, responses, cookies, and headers.
     """
 
-    def __init__(self, har_builder: HARBuilder) -> None:
+    __slots__ = ("_builder", "_max_body_bytes")
+
+    def __init__(self, har_builder: HARBuilder, *, max_body_bytes: Optional[int] = None) -> None:
         """
         Initialize the formatter with a HARBuilder instance.
 
         :param har_builder: The HARBuilder instance to use for creating HAR elements.
+        :param max_body_bytes: The maximum size of a response body to record. Larger bodies are
+                               replaced by a comment, without being read when their size is
+                               declared up front. Defaults to no limit.
         """
         self._builder = har_builder
+        self._max_body_bytes = max_body_bytes
+
+    def set_max_body_bytes(self, max_body_bytes: Optional[int]) -> None:
+        """
+        Set the maximum size of a response body to record.
+
+        :param max_body_bytes: The maximum body size in bytes, or None to record every body.
+        """
+        self._max_body_bytes = max_body_bytes
 
     def _format_cookies(self, headers: List[str]) -> List[har.Cookie]:
         """
         Extract and format cookies from HTTP headers into HAR cookies.
 
+        Each header is scanned once: reserved attributes (e.g. Path, Expires, HttpOnly) are
+        attached to the preceding cookie, any other name starts a new cookie.
+
         :param headers: A list of cookie headers.
         :return: A list of HAR cookies.
         """
+        format_cookie = self._format_cookie
         cookies = []
         for header in headers:
-            cookie = SimpleCookie()
-            cookie.load(header)
-            for name, morsel in cookie.items():
-                cookies.append(self._format_cookie(name, morsel))
+            parsed: List[Tuple[str, str, Dict[str, str]]] = []
+            for match in _COOKIE_PAIR_RE.finditer(header):
+                key, value = match.group(1), match.group(2)
+                attr = key.lower()
+                if attr in _COOKIE_ATTRIBUTES:
+                    if parsed:
+                        parsed[-1][2][attr] = value or ""
+                elif value is not None and not key.startswith("$"):
+                    parsed.append((key, _unquote_cookie_value(value), {}))
+            for name, value, attrs in parsed:
+                cookies.append(format_cookie(name, value, attrs))
         return cookies
 
-    def _format_headers(self, headers: httpx.Headers) -> List[har.Header]:
+    def _format_headers(self, headers: httpx.Headers,
+                        cookie_header: str) -> Tuple[List[har.Header], List[str]]:
         """
-        Convert HTTP headers into HAR headers.
+        Convert HTTP headers into HAR headers, collecting the cookie headers on the way.
+
+        The headers are walked once, instead of once more to look up the cookie headers.
 
         :param headers: The HTTP headers to format.
-        :return: A list of HAR headers.
+        :param cookie_header: The lowercased name of the cookie header ('cookie' for requests,
+                              'set-cookie' for responses).
+        :return: A tuple containing a list of HAR headers and a list of cookie header values.
         """
-        return [self._builder.build_header(name, val) for name, val in headers.multi_items()]
+        build_header = self._builder.build_header
+        formatted = []
+        cookies = []
+        # multi_items() yields lowercased names
+        for name, value in headers.multi_items():
+            formatted.append(build_header(name, value))
+            if name == cookie_header:
+                cookies.append(value)
+        return formatted, cookies
 
     def _format_query_params(self, params: httpx.QueryParams) -> List[har.QueryParam]:
         """
@@ -64,31 +171,34 @@ class BaseHARFormatter:
         :param params: The query parameters to format.
         :return: A list of HAR query parameters.
         """
-        return [self._builder.build_query_param(name, val) for name, val in params.multi_items()]
+        if not params:
+            return []
+        return list(starmap(self._builder.build_query_param, params.multi_items()))
 
-    def _format_cookie(self, name: str, morsel: "Morsel[Any]") -> har.Cookie:
+    def _format_cookie(self, name: str, value: str, attrs: Dict[str, str]) -> har.Cookie:
         """
-        Create a HAR cookie from a cookie Morsel object.
+        Create a HAR cookie from a parsed cookie.
 
         :param name: The name of the cookie.
-        :param morsel: The Morsel object containing cookie details.
+        :param value: The value of the cookie.
+        :param attrs: The cookie attributes, keyed by their lowercased names.
         :return: A formatted HAR cookie.
         """
-        path = morsel["path"] if morsel["path"] else None
-        domain = morsel["domain"] if morsel["domain"] else None
-        http_only = morsel["httponly"] if morsel["httponly"] else None
-        secure = morsel["secure"] if morsel["secure"] else None
-        expires = morsel["expires"] if morsel["expires"] else None
+        path = attrs.get("path") or None
+        domain = attrs.get("domain") or None
+        http_only = True if "httponly" in attrs else None
+        secure = True if "secure" in attrs else None
+        expires = attrs.get("expires") or None
         comment = None
 
         if expires:
             try:
-                expires = parsedate_to_datetime(expires).isoformat()
+                expires = _parse_cookie_expires(expires)
             except Exception:
+                comment = f"Invalid date format: {expires}"
                 expires = None
-                comment = f"Invalid date format: {morsel['expires']}"
 
-        return self._builder.build_cookie(name, morsel.value, path, domain, expires,
+        return self._builder.build_cookie(name, value, path, domain, expires,
                                           http_only, secure, comment=comment)
 
     def _format_request_post_data(self, content: bytes, content_type: str) -> har.PostData:
@@ -121,11 +231,17 @@ class BaseHARFormatter:
         :return: A tuple containing the URL-decoded string and a list of HAR post parameters.
         """
         payload = self._decode(content)
-        try:
-            parsed = parse_qsl(payload)
-        except Exception:
-            return payload, []
-        post_params = [self._builder.build_post_param(name, value) for name, value in parsed]
+        build_post_param = self._builder.build_post_param
+        post_params = []
+        # Same result as parse_qsl(keep_blank_values=True), without its per-field overhead
+        for field in payload.split("&"):
+            if field:
+                name, _, value = field.partition("=")
+                # Most fields carry no escapes and are used as they are
+                if "%" in field or "+" in field:
+                    name = unquote_plus(name, errors="replace")
+                    value = unquote_plus(value, errors="replace")
+                post_params.append(build_post_param(name, value))
         return payload, post_params
 
     def _format_multipart(self, content: bytes,
@@ -133,45 +249,124 @@ class BaseHARFormatter:
         """
         Parse multipart/form-data request body into HAR post parameters.
 
+        The body is split on its boundary delimiter directly, and the bodies of file parts are
+        replaced with a "(binary)" placeholder in the returned text.
+
         :param content: The byte content of the multipart data.
         :param content_type: The content type header of the multipart data.
         :return: A tuple containing the multipart string and a list of HAR post parameters.
         """
-        header = f"Content-Type: {content_type}\r\n\r\n"
-        payload = self._decode(content)
+        match = _MULTIPART_BOUNDARY_RE.search(content_type)
+        if match is None:
+            return self._decode(content), []
+        delimiter = b"\r\n--" + (match.group(1) or match.group(2)).encode()
 
         post_params = []
-        multipart = self._parse_multipart(f"{header}{payload}")
-        for part in multipart.get_payload():
-            assert isinstance(part, EmailMessage)
-            name = part.get_param("name", header="Content-Disposition")
-            value = self._decode(part.get_payload(decode=True))  # type: ignore
-            filename = part.get_param("filename", header="Content-Disposition")
+        # A leading CRLF lets the first delimiter be matched the same way as the others
+        chunks = (b"\r\n" + content).split(delimiter)
+        for index in range(1, len(chunks)):
+            chunk = chunks[index]
+            if chunk.startswith(b"--"):
+                break  # The close delimiter, anything after it is the epilogue
+
+            _, _, part = chunk.partition(b"\r\n")
+            if part.startswith(b"\r\n"):
+                raw_headers, body = b"", part[2:]
+            else:
+                raw_headers, _, body = part.partition(b"\r\n\r\n")
+
+            headers = self._parse_part_headers(raw_headers)
+            params = self._parse_disposition_params(headers.get("content-disposition", ""))
+            name = params.get("name") or ""
+            filename = params.get("filename")
 
             if filename:
-                part_type = part.get_content_type()
-                post_param = self._builder.build_post_param(name, value,  # type: ignore
-                                                            filename, part_type)  # type: ignore
+                chunks[index] = chunk[:len(chunk) - len(body)] + b"(binary)"
+                post_param = self._builder.build_post_param(name, "(binary)", filename,
+                                                            self._get_part_content_type(headers))
             else:
-                post_param = self._builder.build_post_param(name, value)  # type: ignore
+                value = self._decode_part_body(body, headers)
+                post_param = self._builder.build_post_param(name, self._decode(value))
             post_params.append(post_param)
 
-        content_str = multipart.as_string()
-        return content_str.replace(header, "", 1), post_params
+        return self._decode(delimiter.join(chunks)[2:]), post_params
 
-    def _parse_multipart(self, multipart: str) -> Message:
+    def _decode_part_body(self, body: bytes, headers: Dict[str, str]) -> bytes:
         """
-        Convert a string containing a multipart HTTP request body into an email message object.
+        Undo the Content-Transfer-Encoding of a multipart part body.
+
+        Base64 and quoted-printable bodies are decoded, as email's get_payload(decode=True)
+        does. Any other body, or a base64 body that cannot be decoded, is returned as is.
+
+        :param body: The raw body of the part.
+        :param headers: The headers of the part, keyed by their lowercased names.
+        :return: The decoded body.
+        """
+        encoding = headers.get("content-transfer-encoding", "").strip().lower()
+        if encoding == "base64":
+            try:
+                return a2b_base64(body)
+            except BinasciiError:
+                return body
+        if encoding == "quoted-printable":
+            return a2b_qp(body)
+        return body
+
+    def _parse_part_headers(self, raw_headers: bytes) -> Dict[str, str]:
+        """
+        Parse the headers of a single multipart part.
+
+        :param raw_headers: The raw header block of the part, without the trailing blank line.
+        :return: A dictionary of the part headers, keyed by their lowercased names.
+        """
+        headers: Dict[str, str] = {}
+        for line in self._decode(raw_headers).split("\r\n"):
+            name, separator, value = line.partition(":")
+            if separator:
+                headers.setdefault(name.strip().lower(), value.strip())
+        return headers
+
+    def _parse_disposition_params(self, disposition: str) -> Dict[str, str]:
+        """
+        Parse the parameters of a Content-Disposition header of a multipart part.
+
+        Quoted values are unescaped, and RFC 2231 extended values (e.g. filename*=utf-8''...)
+        are decoded and take precedence over their plain counterparts.
+
+        :param disposition: The value of the Content-Disposition header.
+        :return: A dictionary of the parameters, keyed by their lowercased names.
+        """
+        params: Dict[str, str] = {}
+        extended: Dict[str, str] = {}
+        for match in _DISPOSITION_PARAM_RE.finditer(disposition):
+            key, quoted, token = match.groups()
+            key = key.lower()
+            if key.endswith("*"):
+                charset, _, rest = (token if quoted is None else quoted).partition("'")
+                _, _, encoded = rest.partition("'")
+                try:
+                    value = unquote(encoded, encoding=charset or "utf-8", errors="replace")
+                except LookupError:
+                    value = unquote(encoded, errors="replace")
+                extended.setdefault(key[:-1], value)
+            elif quoted is not None:
+                params.setdefault(key, _QUOTED_PAIR_RE.sub(r"\1", quoted))
+            else:
+                params.setdefault(key, token)
+        params.update(extended)
+        return params
 
-        :param multipart: The multipart content as a string.
-        :return: An email message object representing the multipart content.
+    def _get_part_content_type(self, headers: Dict[str, str]) -> str:
         """
-        message: Message = Parser(policy=HTTPPolicy).parsestr(multipart)
-        for part in message.get_payload():
-            assert isinstance(part, EmailMessage)
-            if part.get_param("filename", header="Content-Disposition"):
-                part.set_payload("(binary)")
-        return message
+        Determine the media type of a multipart part.
+
+        :param headers: The headers of the part, keyed by their lowercased names.
+        :return: The lowercased media type, or 'text/plain' if it is missing or invalid.
+        """
+        content_type = headers.get("content-type", "").partition(";")[0].strip().lower()
+        if content_type.count("/") != 1:
+            return "text/plain"
+        return content_type
 
     def _format_elapsed(self, response: httpx.Response) -> int:
         """
@@ -183,6 +378,10 @@ class BaseHARFormatter:
         try:
             elapsed = response.elapsed
         except RuntimeError:
+            # The response is still open, measure from the monotonic start time if it was stamped
+            started_at_ns = response.request.extensions.get("vedro_httpx_started_at_ns")
+            if started_at_ns is not None:
+                return int((perf_counter_ns() - started_at_ns) // 1_000_000)
             elapsed = datetime.now() - self._get_request_started_at(response.request)
         return int(elapsed.total_seconds() * 1000)
 
@@ -198,57 +397,90 @@ class BaseHARFormatter:
         if size == 0:
             return self._builder.build_response_content(content_type, size)
 
+        if self._max_body_bytes is not None and size > self._max_body_bytes:
+            return self._format_oversized_content(content_type, size)
+
         if self._is_text_content(content_type):
             text = self._decode(content)
             return self._builder.build_response_content(content_type, size, text)
+
+        if _HAS_PYBASE64:
+            # SIMD-accelerated, and returns the str directly without an intermediate bytes copy
+            text = pybase64.b64encode_as_string(content)
         else:
-            text = b64encode(content).decode()
-            return self._builder.build_response_content(content_type, size, text,
-                                                        encoding="base64")
+            text = b64encode(content).decode("ascii")
+        return self._builder.build_response_content(content_type, size, text, encoding="base64")
 
-    def _decode(self, value: bytes, encoding: str = "utf-8") -> str:
+    def _format_declared_oversized_content(self, response: httpx.Response,
+                                           content_type: str) -> Union[har.Content, None]:
         """
-        Decode byte content using a specified encoding.
+        Format the content of a response whose declared size exceeds the body size limit.
 
-        :param value: The byte content to decode.
-        :param encoding: The encoding to use for decoding.
-        :return: The decoded string.
+        The Content-Length header is not trusted for responses to HEAD requests, which have no
+        body, nor for encoded responses, where it is the size on the wire rather than the size
+        of the decoded body.
+
+        :param response: The HTTP response whose declared size is checked.
+        :param content_type: The content type of the response.
+        :return: A HAR content object without the body, or None if the body is to be recorded.
         """
+        if self._max_body_bytes is None:
+            return None
+        headers = response.headers
+        if "Content-Encoding" in headers or self._is_head_response(response):
+            return None
         try:
-            return value.decode(encoding)
-        except UnicodeDecodeError:
-            return value.decode(encoding, errors="surrogateescape")
+            size = int(headers.get("Content-Length", ""))
+        except ValueError:
+            return None
+        if size <= self._max_body_bytes:
+            return None
+        return self._format_oversized_content(content_type, size)
 
-    def _is_text_content(self, content_type: str) -> bool:
+    def _is_head_response(self, response: httpx.Response) -> bool:
         """
-        Determine if the given content type is text-based.
+        Determine if the response is a response to a HEAD request.
 
-        :param content_type: The content type to evaluate.
-        :return: True if the content type is text-based, otherwise False.
+        :param response: The HTTP response to check.
+        :return: True if the response belongs to a HEAD request, otherwise False.
         """
-        return (
-            content_type.startswith("text/") or
-            content_type.startswith("application/json") or
-            content_type.startswith("application/xml")
+        try:
+            return response.request.method == "HEAD"
+        except RuntimeError:  # The response was built without a request
+            return False
+
+    def _format_oversized_content(self, content_type: str, size: int) -> har.Content:
+        """
+        Format the content of a response body that exceeds the body size limit.
+
+        :param content_type: The content type of the response.
+        :param size: The size of the response body in bytes.
+        :return: A HAR content object without the body.
+        """
+        return self._builder.build_response_content(
+            content_type, size, comment=f"Body exceeds {self._max_body_bytes} bytes, not recorded"
         )
 
-    def _get_request_cookies(self, headers: httpx.Headers) -> List[str]:
+    def _decode(self, value: bytes, encoding: str = "utf-8") -> str:
         """
-        Retrieve the cookie headers from a request.
+        Decode byte content using a specified encoding.
 
-        :param headers: The HTTP headers from which to extract cookie data.
-        :return: A list of cookie header strings.
+        Invalid sequences are replaced with U+FFFD, so the text can always be serialized to JSON.
+
+        :param value: The byte content to decode.
+        :param encoding: The encoding to use for decoding.
+        :return: The decoded string.
         """
-        return headers.get_list("Cookie")
+        return value.decode(encoding, errors="replace")
 
-    def _get_response_cookies(self, headers: httpx.Headers) -> List[str]:
+    def _is_text_content(self, content_type: str) -> bool:
         """
-        Retrieve the Set-Cookie headers from a response.
+        Determine if the given content type is text-based.
 
-        :param headers: The HTTP headers from which to extract Set-Cookie data.
-        :return: A list of Set-Cookie header strings.
+        :param content_type: The content type to evaluate.
+        :return: True if the content type is text-based, otherwise False.
         """
-        return headers.get_list("Set-Cookie")
+        return _is_text_content_type(content_type)
 
     def _get_location_header(self, headers: httpx.Headers) -> str:
         """
@@ -257,7 +489,8 @@ class BaseHARFormatter:
         :param headers: The HTTP headers from which to retrieve the Location header.
         :return: The value of the Location header, or an empty string if not present.
         """
-        return cast(str, headers.get("Location", ""))
+        location: str = headers.get("Location", "")
+        return location
 
     def _get_content_type(self, headers: httpx.Headers) -> str:
         """
@@ -266,7 +499,8 @@ class BaseHARFormatter:
         :param headers: The HTTP headers from which to retrieve the content type.
         :return: The content type as a string, or 'x-unknown' if not specified.
         """
-        return cast(str, headers.get("Content-Type", "x-unknown"))
+        content_type: str = headers.get("Content-Type", "x-unknown")
+        return content_type
 
     def _get_server_ip_address(self, response: httpx.Response) -> Union[str, None]:
         """
@@ -290,8 +524,14 @@ class BaseHARFormatter:
         :param request: The request object from which to extract the start time.
         :return: The datetime object representing when the request was started.
         """
-        started_at = request.extensions.get("vedro_httpx_started_at", datetime.now())
-        return cast(datetime, started_at)
+        started_at: Optional[datetime] = request.extensions.get("vedro_httpx_started_at")
+        if started_at is None:
+            # Clients stamp the wall clock as integer nanoseconds, converted only when formatting
+            started_at_ns = request.extensions.get("vedro_httpx_started_at_wall_ns")
+            if started_at_ns is None:
+                return datetime.now()
+            return datetime.fromtimestamp(started_at_ns / 1e9)
+        return started_at
 
     def _format_request_started_at(self, request: httpx.Request) -> str:
         """
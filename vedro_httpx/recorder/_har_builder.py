@@ -13,6 +13,8 @@ class HARBuilder:
     such as requests, responses, cookies, headers, and the complete HAR object.
     """
 
+    __slots__ = ("_creator_name", "_creator_version")
+
     def __init__(self, creator_name: str, creator_version: str) -> None:
         """
         Initialize the HARBuilder with a creator's name and version.
@@ -224,13 +226,15 @@ class HARBuilder:
         return post_param
 
     def build_post_data(self, mime_type: str, text: str,
-                        params: Optional[List[har.PostParam]] = None) -> har.PostData:
+                        params: Optional[List[har.PostParam]] = None, *,
+                        comment: Optional[str] = None) -> har.PostData:
         """
         Construct post data for a HAR request.
 
         :param mime_type: The MIME type of the post data.
         :param text: The raw text of the post data.
         :param params: A list of post parameters associated with the post data (optional).
+        :param comment: A comment about the post data (optional).
         :return: A post data dictionary.
         """
         post_data: har.PostData = {
@@ -239,6 +243,8 @@ class HARBuilder:
         }
         if params is not None:
             post_data["params"] = params
+        if comment is not None:
+            post_data["comment"] = comment
         return post_data
 
     def build_response(self,
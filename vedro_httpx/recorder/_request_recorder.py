@@ -1,6 +1,7 @@
 import json
+from collections import deque
 from pathlib import Path
-from typing import List
+from typing import Awaitable, Deque, Generator, Optional
 
 from .._response import Response
 from .._version import version as vedro_httpx_version
@@ -9,8 +10,29 @@ from ._har_builder import HARBuilder
 from ._sync_har_formatter import SyncHARFormatter
 from .har import Entry
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    _HAS_ORJSON = False
+else:
+    _HAS_ORJSON = True
+
 __all__ = ("request_recorder", "RequestRecorder",)
 
+_WRITE_BUFFER_SIZE = 1 << 20
+
+
+class _CompletedAwaitable:
+    """
+    An awaitable that completes immediately without suspending the awaiting coroutine.
+    """
+
+    def __await__(self) -> Generator[None, None, None]:
+        yield from ()
+
+
+_COMPLETED = _CompletedAwaitable()
+
 
 class RequestRecorder:
     """
@@ -20,19 +42,22 @@ class RequestRecorder:
 
     def __init__(self, har_builder: HARBuilder,
                  sync_har_formatter: SyncHARFormatter,
-                 async_har_formatter: AsyncHARFormatter) -> None:
+                 async_har_formatter: AsyncHARFormatter, *,
+                 max_entries: Optional[int] = None) -> None:
         """
         Initializes the request recorder with necessary HAR formatting tools.
 
         :param har_builder: The HARBuilder to use for creating HAR objects.
         :param sync_har_formatter: The synchronous HAR formatter.
         :param async_har_formatter: The asynchronous HAR formatter.
+        :param max_entries: The maximum number of entries to keep. When the limit is reached,
+                            the oldest entries are discarded. Defaults to no limit.
         """
         self._har_builder = har_builder
         self._sync_formatter = sync_har_formatter
         self._async_formatter = async_har_formatter
         self._enabled: bool = False
-        self._entries: List[Entry] = []
+        self._entries: Deque[Entry] = deque(maxlen=max_entries)
 
     def enable(self) -> None:
         """
@@ -54,15 +79,28 @@ class RequestRecorder:
         """
         return self._enabled
 
-    async def async_record(self, response: Response) -> None:
+    def async_record(self, response: Response) -> Awaitable[None]:
         """
         Record an HTTP transaction if recording is enabled.
 
+        When recording is disabled, an already completed awaitable is returned, so the caller
+        does not pay for creating and running a coroutine.
+
         :param response: The HTTP Response object to record.
+        :return: An awaitable that completes once the transaction is recorded.
         """
-        if self._enabled:
-            formatted = await self._async_formatter.format_entry(response, response.request)
-            self._entries.append(formatted)
+        if not self._enabled:
+            return _COMPLETED
+        return self._async_record(response)
+
+    async def _async_record(self, response: Response) -> None:
+        """
+        Format an HTTP transaction asynchronously and store it as a HAR entry.
+
+        :param response: The HTTP Response object to record.
+        """
+        formatted = await self._async_formatter.format_entry(response, response.request)
+        self._entries.append(formatted)
 
     def sync_record(self, response: Response) -> None:
         """
@@ -74,6 +112,17 @@ class RequestRecorder:
             formatted = self._sync_formatter.format_entry(response, response.request)
             self._entries.append(formatted)
 
+    def set_max_body_bytes(self, max_body_bytes: Optional[int]) -> None:
+        """
+        Set the maximum size of a response body to record, for both formatters.
+
+        Larger bodies are replaced by a comment in the HAR entry.
+
+        :param max_body_bytes: The maximum body size in bytes, or None to record every body.
+        """
+        self._sync_formatter.set_max_body_bytes(max_body_bytes)
+        self._async_formatter.set_max_body_bytes(max_body_bytes)
+
     def reset(self) -> None:
         """
         Reset the recorded entries.
@@ -86,9 +135,19 @@ class RequestRecorder:
 
         :param file_path: The path to the file where the HAR data will be saved.
         """
-        log = self._har_builder.build_log(self._entries)
+        log = self._har_builder.build_log(list(self._entries))
         har = self._har_builder.build_har(log)
-        file_path.write_text(json.dumps(har, indent=2, ensure_ascii=False))
+        if _HAS_ORJSON:
+            try:
+                file_path.write_bytes(orjson.dumps(har, option=orjson.OPT_INDENT_2))
+            except TypeError:
+                pass  # e.g. integers beyond 64 bits, left to the standard library encoder
+            else:
+                return
+        # Encode straight into the file, so the whole document never exists as a single string.
+        # json.dump() emits many small chunks, a large buffer turns them into few writes
+        with file_path.open("w", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE) as file:
+            json.dump(har, file, indent=2, ensure_ascii=False)
 
 
 _har_builder = HARBuilder("vedro-httpx", vedro_httpx_version)
@@ -17,6 +17,8 @@ class SyncHARFormatter(BaseHARFormatter):
     response data into the standardized HAR format.
     """
 
+    __slots__ = ()
+
     def format(self, responses: List[httpx.Response]) -> har.Log:
         """
         Create a HAR log from a list of HTTP responses.
@@ -27,11 +29,8 @@ class SyncHARFormatter(BaseHARFormatter):
         :param responses: A list of httpx.Response objects to be formatted.
         :return: A HAR log dictionary that encapsulates all the formatted entries.
         """
-        entries = []
-        for response in responses:
-            entry = self.format_entry(response, response.request)
-            entries.append(entry)
-
+        format_entry = self.format_entry
+        entries = [format_entry(response, response.request) for response in responses]
         return self._builder.build_log(entries)
 
     def format_entry(self, response: httpx.Response, request: httpx.Request) -> har.Entry:
@@ -61,21 +60,29 @@ class SyncHARFormatter(BaseHARFormatter):
         :param http_version: The HTTP version to use in the formatting (default "HTTP/1.1").
         :return: A HAR request dictionary.
         """
-        if content := request.read():
+        post_data = None
+        try:
+            content = request.read()
+        except httpx.StreamConsumed:
             content_type = self._get_content_type(request.headers)
-            post_data = self._format_request_post_data(content, content_type)
+            post_data = self._builder.build_post_data(content_type, "(stream)",
+                                                      comment="Stream consumed")
         else:
-            post_data = None
+            if content:
+                content_type = self._get_content_type(request.headers)
+                post_data = self._format_request_post_data(content, content_type)
 
         parameterized_url = request.extensions.get("vedro_httpx_parameterized_url", None)
+        headers, cookies = self._format_headers(request.headers, "cookie")
+        url = request.url
 
         return self._builder.build_request(
             method=request.method,
-            url=str(request.url),
+            url=str(url),
             http_version=http_version,
-            query_string=self._format_query_params(request.url.params),
-            headers=self._format_headers(request.headers),
-            cookies=self._format_cookies(self._get_request_cookies(request.headers)),
+            query_string=self._format_query_params(url.params),
+            headers=headers,
+            cookies=self._format_cookies(cookies) if cookies else [],
             post_data=post_data,
             parameterized_url=parameterized_url,
         )
@@ -87,12 +94,13 @@ class SyncHARFormatter(BaseHARFormatter):
         :param response: The httpx.Response object to format.
         :return: A HAR response dictionary encapsulating the formatted response details.
         """
+        headers, cookies = self._format_headers(response.headers, "set-cookie")
         return self._builder.build_response(
             status=response.status_code,
             status_text=response.reason_phrase,
             http_version=response.http_version,
-            cookies=self._format_cookies(self._get_response_cookies(response.headers)),
-            headers=self._format_headers(response.headers),
+            cookies=self._format_cookies(cookies) if cookies else [],
+            headers=headers,
             content=self.format_response_content(response),
             redirect_url=self._get_location_header(response.headers),
         )
@@ -105,6 +113,8 @@ class SyncHARFormatter(BaseHARFormatter):
         :return: A HAR content dictionary.
         """
         content_type = self._get_content_type(response.headers)
+        if oversized := self._format_declared_oversized_content(response, content_type):
+            return oversized
         try:
             content = response.read()
         except httpx.StreamConsumed: